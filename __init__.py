@@ -23,20 +23,420 @@ bl_info = {
 import bpy
 import gpu
 import os
-from gpu_extras.batch import batch_for_shader
+import time
+from pathlib import PurePath
+import numpy as np
+from bpy.app.handlers import persistent
 from bpy.props import (
     StringProperty, FloatProperty, FloatVectorProperty,
     CollectionProperty, IntProperty, BoolProperty
 )
 
-_shader = gpu.shader.from_builtin('IMAGE_COLOR')
+_MAX_INSTANCES = 256
+
+def _create_shader():
+    # Per-image placement, atlas rect and opacity live in a uniform buffer
+    # indexed by the instance index, so every image on an atlas page is drawn
+    # from the same unit quad in one instanced call. Each atlas rect takes
+    # two unorm16 pairs (two instances per uvec4) and each opacity a single
+    # unorm8 byte (sixteen instances per uvec4).
+    interface = gpu.types.GPUStageInterfaceInfo("ryref_interface")
+    interface.smooth('VEC2', "uvInterp")
+    interface.flat('FLOAT', "alphaInterp")
+
+    info = gpu.types.GPUShaderCreateInfo()
+    info.typedef_source(
+        "struct RyRefInstances\n"
+        "{\n"
+        f"  vec4 xywh[{_MAX_INSTANCES}];\n"
+        f"  uvec4 uv_rect[{_MAX_INSTANCES // 2}];\n"
+        f"  uvec4 alpha[{_MAX_INSTANCES // 16}];\n"
+        "};\n"
+    )
+    info.uniform_buf(0, "RyRefInstances", "instances")
+    info.push_constant('MAT4', "ModelViewProjectionMatrix")
+    info.sampler(0, 'FLOAT_2D', "image")
+    info.vertex_in(0, 'VEC2', "pos")
+    info.vertex_out(interface)
+    info.fragment_out(0, 'VEC4', "fragColor")
+    info.vertex_source(
+        "void main()\n"
+        "{\n"
+        "  int i = gpu_InstanceIndex;\n"
+        "  vec4 rect = instances.xywh[i];\n"
+        "  uvec4 uv_pair = instances.uv_rect[i >> 1];\n"
+        "  uvec2 uv = ((i & 1) == 0) ? uv_pair.xy : uv_pair.zw;\n"
+        "  vec2 uv_min = vec2(uv.x & 0xFFFFu, uv.x >> 16u) / 65535.0;\n"
+        "  vec2 uv_max = vec2(uv.y & 0xFFFFu, uv.y >> 16u) / 65535.0;\n"
+        "  uvInterp = mix(uv_min, uv_max, pos);\n"
+        "  uint alpha_word = instances.alpha[i >> 4][(i >> 2) & 3];\n"
+        "  alphaInterp = float((alpha_word >> (uint(i & 3) * 8u)) & 0xFFu) / 255.0;\n"
+        "  gl_Position = ModelViewProjectionMatrix * vec4(rect.xy + pos * rect.zw, 0.0, 1.0);\n"
+        "}\n"
+    )
+    info.fragment_source(
+        "void main()\n"
+        "{\n"
+        "  fragColor = texture(image, uvInterp);\n"
+        "  fragColor.a *= alphaInterp;\n"
+        "}\n"
+    )
+    return gpu.shader.create_from_info(info)
+
+_shader = None
+_quad_batch = None
 _draw_handle = None
 _image_cache = {}
+_cache_keys = {}
+_pending_loads = []
+_instance_cache = []
+_instance_cache_key = None
+_dirty = True
+_overlay_animated = False
+_overlay_scene = None
+
+_QUAD_CORNERS = np.array(((0, 0), (1, 0), (1, 1), (0, 1)), dtype=np.uint8)
+_QUAD_INDICES = np.array(((0, 1, 2), (2, 3, 0)), dtype=np.uint32)
+
+# Unit-square UV rects (u0, v0, u1, v1) for every flip combination, indexed
+# by (flip_x << 1) | flip_y. Flipping an axis swaps that axis' edges.
+_UV_VARIANTS = tuple(
+    (float(flip_x), float(flip_y), float(not flip_x), float(not flip_y))
+    for flip_x in (False, True)
+    for flip_y in (False, True)
+)
+
+_ATLAS_PAGE_SIZE = 2048
+_ATLAS_PADDING = 4
+_atlas_pages = []
+
+_REDRAW_INTERVAL = 1.0 / 60.0
+_last_tag_time = 0.0
+_pending_tag = False
+
+def _tag_view3d_areas():
+    # Areas are looked up fresh on every tag: Python has no cheap signal for
+    # area splits and joins, and holding on to a freed area is unsafe.
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+def _flush_tag():
+    global _last_tag_time, _pending_tag
+    _pending_tag = False
+    _last_tag_time = time.monotonic()
+    _tag_view3d_areas()
+    return None
 
 def tag_redraw():
-    for area in bpy.context.screen.areas:
-        if area.type == 'VIEW_3D':
-            area.tag_redraw()
+    # Slider drags fire updates far faster than the viewport can repaint, so
+    # redraws are capped to _REDRAW_INTERVAL with a trailing timer making sure
+    # the final value of a drag is still drawn.
+    global _last_tag_time, _pending_tag, _dirty
+    _dirty = True
+    if _pending_tag:
+        return
+
+    now = time.monotonic()
+    remaining = _REDRAW_INTERVAL - (now - _last_tag_time)
+    if remaining > 0.0:
+        # Persistent, since a non-persistent timer is dropped on file load
+        # and would leave _pending_tag stuck, suppressing every later redraw.
+        _pending_tag = True
+        bpy.app.timers.register(_flush_tag, first_interval=remaining, persistent=True)
+        return
+
+    _last_tag_time = now
+    _tag_view3d_areas()
+
+_any_visible = False
+_any_visible_scene = None
+
+@persistent
+def _invalidate_visibility(*args):
+    global _any_visible_scene, _dirty
+    _any_visible_scene = None
+    _dirty = True
+
+def _on_prop_update(self, context):
+    tag_redraw()
+
+def _on_filepath_update(self, context):
+    # The image this reference pointed at is released unless another
+    # reference in any scene still shows it.
+    previous = self.get("_prev_filepath")
+    if previous is not None and previous != self.filepath:
+        _release_unused_image(_cache_key(previous))
+    self["_prev_filepath"] = self.filepath
+    tag_redraw()
+
+def _on_visibility_update(self, context):
+    _invalidate_visibility()
+    tag_redraw()
+
+def _has_visible_images(scene, images):
+    # Only recounted after a visibility toggle, list edit, undo, file load or
+    # scene switch, so the draw handler normally pays for a single compare.
+    # Keyframed or driven visibility changes without any callback, so a scene
+    # with animation data is always recounted.
+    global _any_visible, _any_visible_scene
+    if scene != _any_visible_scene or scene.animation_data is not None:
+        _any_visible = any(img.visible for img in images)
+        _any_visible_scene = scene
+    return _any_visible
+
+def _new_atlas_image(width, height):
+    return bpy.data.images.new(".RyRef Atlas", width, height, alpha=True)
+
+class _AtlasPage:
+    """A shelf-packed texture holding the pixels of several reference images."""
+
+    __slots__ = ('image', 'pixels', 'shelves', 'gpu_tex', 'users', 'pending')
+
+    def __init__(self, width, height):
+        # Uploading through a hidden Image datablock gives the page the same
+        # sRGB texture format, mipmaps and filtering as gpu.texture.from_image.
+        self.image = _new_atlas_image(width, height)
+        self.pixels = np.zeros((height, width, 4), dtype=np.uint8)
+        self.shelves = []
+        self.gpu_tex = None
+        self.users = 0
+        self.pending = []
+
+    def allocate(self, width, height):
+        page_height, page_width = self.pixels.shape[:2]
+        for shelf in self.shelves:
+            y, shelf_height, x = shelf
+            if height <= shelf_height and x + width <= page_width:
+                shelf[2] += width
+                return x, y
+
+        y = self.shelves[-1][0] + self.shelves[-1][1] if self.shelves else 0
+        if width > page_width or y + height > page_height:
+            return None
+        self.shelves.append([y, height, width])
+        return 0, y
+
+    def ensure_image(self):
+        # The page image has no users, so Purge Unused Data can delete it.
+        # The CPU copy of the pixels is enough to recreate it.
+        try:
+            self.image.name
+        except ReferenceError:
+            height, width = self.pixels.shape[:2]
+            self.image = _new_atlas_image(width, height)
+
+    def free(self):
+        try:
+            bpy.data.images.remove(self.image)
+        except ReferenceError:
+            pass
+
+    def upload(self):
+        self.ensure_image()
+        self.image.pixels.foreach_set(
+            np.multiply(self.pixels.ravel(), np.float32(1.0 / 255.0), dtype=np.float32)
+        )
+        self.image.update()
+        self.image.gpu_free()
+        self.gpu_tex = gpu.texture.from_image(self.image)
+
+class _CacheEntry:
+    """The texture a loaded reference image is drawn from.
+
+    Atlas entries draw from their page's texture; images that skip the atlas
+    have no page and keep their own.
+    """
+
+    __slots__ = ('page', 'gpu_tex', 'uv_variants', 'size', 'ready')
+
+    def __init__(self, page, gpu_tex, uv_variants, size):
+        self.page = page
+        self.gpu_tex = gpu_tex
+        self.uv_variants = uv_variants
+        self.size = size
+        self.ready = page is None
+
+    def texture(self):
+        return self.gpu_tex if self.page is None else self.page.gpu_tex
+
+def _fits_atlas(image):
+    # Only 8-bit sRGB images that fit a standard page are packed. Anything
+    # else keeps its own texture so its colorspace, bit depth and resolution
+    # are handled by Blender instead of being squeezed into an 8-bit page.
+    limit = _ATLAS_PAGE_SIZE - 2 * _ATLAS_PADDING
+    width, height = image.size
+    return (
+        not image.is_float
+        and image.colorspace_settings.name == 'sRGB'
+        and width <= limit
+        and height <= limit
+    )
+
+def _atlas_add(image):
+    width, height = image.size
+    pixels = np.empty(width * height * 4, dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    pixels = pixels.reshape(height, width, 4)
+
+    # Edge pixels are repeated into the padding so filtering and mipmaps
+    # don't bleed neighbouring images into this one.
+    pad = _ATLAS_PADDING
+    pixels = np.clip(pixels * 255.0 + 0.5, 0.0, 255.0).astype(np.uint8)
+    pixels = np.pad(pixels, ((pad, pad), (pad, pad), (0, 0)), mode='edge')
+    padded_height, padded_width = pixels.shape[:2]
+
+    for page in _atlas_pages:
+        origin = page.allocate(padded_width, padded_height)
+        if origin is not None:
+            break
+    else:
+        page = _AtlasPage(_ATLAS_PAGE_SIZE, _ATLAS_PAGE_SIZE)
+        _atlas_pages.append(page)
+        origin = page.allocate(padded_width, padded_height)
+
+    x, y = origin
+    page.pixels[y:y + padded_height, x:x + padded_width] = pixels
+
+    page_height, page_width = page.pixels.shape[:2]
+    rect = (
+        (x + pad) / page_width,
+        (y + pad) / page_height,
+        (x + pad + width) / page_width,
+        (y + pad + height) / page_height,
+    )
+    return page, rect
+
+def _atlas_uv_variants(rect):
+    u0, v0, u1, v1 = rect
+    du = u1 - u0
+    dv = v1 - v0
+    return tuple(
+        (u0 + a * du, v0 + b * dv, u0 + c * du, v0 + d * dv)
+        for a, b, c, d in _UV_VARIANTS
+    )
+
+def _atlas_release(page):
+    # Space freed inside a page isn't repacked; the page is dropped once the
+    # last image on it goes away.
+    page.users -= 1
+    if page.users == 0:
+        _atlas_pages.remove(page)
+        page.free()
+
+def _cache_key(filepath):
+    # Relative and absolute spellings of the same file share one cache entry.
+    # Resolved paths are memoized since the draw handler looks them up every
+    # frame; relative paths only change meaning when another file is loaded
+    # or the current one is saved somewhere else.
+    key = _cache_keys.get(filepath)
+    if key is None:
+        key = os.path.normcase(os.path.normpath(bpy.path.abspath(filepath)))
+        _cache_keys[filepath] = key
+    return key
+
+@persistent
+def _clear_cache_keys(*args):
+    # Saving under a new name moves what "//" paths resolve to.
+    _cache_keys.clear()
+
+def _release_image(filepath):
+    cached = _image_cache.pop(filepath, None)
+    if cached is not None and cached.page is not None:
+        _atlas_release(cached.page)
+
+def _release_unused_image(filepath):
+    # The image cache is shared by every scene in the file.
+    for scene in bpy.data.scenes:
+        if any(_cache_key(img.filepath) == filepath for img in scene.ryref_images):
+            return
+    _release_image(filepath)
+
+@persistent
+def _clear_image_cache(*args):
+    # The cached images and atlas pages belong to the file being unloaded.
+    _image_cache.clear()
+    _cache_keys.clear()
+    _pending_loads.clear()
+    _atlas_pages.clear()
+
+def _load_image(filepath):
+    # Failed loads are cached as None so a missing file isn't retried on
+    # every redraw. An atlas image is only packed into its page here; it
+    # becomes drawable once _upload_atlas_pages() has sent the page to the GPU.
+    page = gpu_tex = None
+    try:
+        image_count = len(bpy.data.images)
+        image = bpy.data.images.load(filepath, check_existing=True)
+        owned = len(bpy.data.images) > image_count
+        size = tuple(image.size)
+        if not image.has_data or size[0] == 0 or size[1] == 0:
+            raise RuntimeError("Image has no pixel data")
+        if _fits_atlas(image):
+            page, rect = _atlas_add(image)
+        else:
+            gpu_tex = gpu.texture.from_image(image)
+    except Exception:
+        _image_cache[filepath] = None
+        return
+
+    # Images with their own texture are drawn straight from the datablock,
+    # so they keep their buffers.
+    if page is None:
+        _image_cache[filepath] = _CacheEntry(None, gpu_tex, _UV_VARIANTS, size)
+        return
+
+    # The atlas holds the only copy the overlay needs. An image that was
+    # already in the file may be in use or painted and unsaved, so only
+    # datablocks created here are freed.
+    if owned:
+        image.buffers_free()
+
+    entry = _CacheEntry(page, None, _atlas_uv_variants(rect), size)
+    _image_cache[filepath] = entry
+    page.users += 1
+    page.pending.append((filepath, entry))
+
+def _upload_atlas_pages():
+    # Each page touched by a batch of loads is uploaded once, however many
+    # images were packed into it.
+    for page in list(_atlas_pages):
+        if not page.pending:
+            continue
+        pending = page.pending
+        page.pending = []
+        try:
+            page.upload()
+        except Exception:
+            for filepath, entry in pending:
+                if _image_cache.get(filepath) is entry:
+                    _image_cache[filepath] = None
+                    _atlas_release(page)
+            continue
+        for filepath, entry in pending:
+            entry.ready = True
+
+def _load_pending_images():
+    # Loads one image per timer tick so a backlog (e.g. after opening a file)
+    # never stalls the UI for longer than a single decode, and uploads the
+    # touched atlas pages once the backlog has drained.
+    if _pending_loads:
+        filepath = _pending_loads.pop(0)
+        if filepath not in _image_cache:
+            _load_image(filepath)
+    if _pending_loads:
+        return 0.0
+    _upload_atlas_pages()
+    tag_redraw()
+    return None
+
+def _request_image_load(filepath):
+    if filepath in _pending_loads:
+        return
+    _pending_loads.append(filepath)
+    if not bpy.app.timers.is_registered(_load_pending_images):
+        bpy.app.timers.register(_load_pending_images)
 
 class RyRefImage(bpy.types.PropertyGroup):
     """Data container for a reference image overlay."""
@@ -49,19 +449,21 @@ class RyRefImage(bpy.types.PropertyGroup):
     filepath: StringProperty(
         name="File Path",
         description="Path to the reference image",
-        subtype='FILE_PATH'
+        subtype='FILE_PATH',
+        update=_on_filepath_update
     )
     visible: BoolProperty(
         name="Visible",
         description="Toggle visibility of this reference image",
-        default=True
+        default=True,
+        update=_on_visibility_update
     )
     position: FloatVectorProperty(
         name="Position",
         description="Screen-space position of the image (bottom-left corner)",
         size=2, default=(100.0, 100.0),
         step=10, precision=1,
-        update=lambda self, context: tag_redraw()
+        update=_on_prop_update
     )
     scale: FloatVectorProperty(
         name="Scale",
@@ -69,86 +471,179 @@ class RyRefImage(bpy.types.PropertyGroup):
         size=2, default=(0.2, 0.2),
         soft_min=0.01, soft_max=2.0,
         step=0.01, precision=2,
-        update=lambda self, context: tag_redraw()
+        update=_on_prop_update
     )
     opacity: FloatProperty(
         name="Opacity",
         description="Transparency level of the image",
         default=1.0, min=0.0, max=1.0,
         step=0.01, precision=2,
-        update=lambda self, context: tag_redraw()
+        update=_on_prop_update
     )
     flip_x: BoolProperty(
         name="Flip X",
         description="Flip image horizontally",
         default=False,
-        update=lambda self, context: tag_redraw()
+        update=_on_prop_update
     )
     flip_y: BoolProperty(
         name="Flip Y",
         description="Flip image vertically",
         default=False,
-        update=lambda self, context: tag_redraw()
+        update=_on_prop_update
     )
 
 
+def _get_shader():
+    # Built on the first draw rather than at import, so enabling the add-on
+    # costs nothing until a viewport actually shows references.
+    global _shader
+    if _shader is None:
+        _shader = _create_shader()
+    return _shader
+
+def _get_quad_batch():
+    # Corners are fetched as bytes; the GPU converts the 0 and 1 values to floats.
+    global _quad_batch
+    if _quad_batch is None:
+        vert_format = gpu.types.GPUVertFormat()
+        vert_format.attr_add(id="pos", comp_type='U8', len=2, fetch_mode='INT_TO_FLOAT')
+        vbo = gpu.types.GPUVertBuf(vert_format, len(_QUAD_CORNERS))
+        vbo.attr_fill("pos", _QUAD_CORNERS)
+        ibo = gpu.types.GPUIndexBuf(type='TRIS', seq=_QUAD_INDICES)
+        _quad_batch = gpu.types.GPUBatch(type='TRIS', buf=vbo, elem=ibo)
+    return _quad_batch
+
+def _build_instances(rows):
+    # Each row is (x, y, scale_x, scale_y, width, height, opacity) followed by
+    # the image's already-flipped atlas UV rect. The block matches the std140
+    # layout of RyRefInstances in the shader.
+    data = np.array(rows, dtype=np.float32)
+    count = len(data)
+
+    block = np.zeros(_MAX_INSTANCES * 6 + _MAX_INSTANCES // 4, dtype=np.uint32)
+    xywh = block[:_MAX_INSTANCES * 4].view(np.float32).reshape(_MAX_INSTANCES, 4)
+    uv_words = block[_MAX_INSTANCES * 4:_MAX_INSTANCES * 6].reshape(_MAX_INSTANCES, 2)
+    # Byte i of the alpha words is bits (i & 3) * 8 of word i >> 2 on the
+    # little-endian hosts Blender runs on.
+    alpha = block[_MAX_INSTANCES * 6:].view(np.uint8)
+
+    xywh[:count, 0:2] = data[:, 0:2]
+    xywh[:count, 2:4] = data[:, 2:4] * data[:, 4:6]
+
+    uv_rect = np.rint(data[:, 7:11] * 65535.0).astype(np.uint32)
+    uv_words[:count, 0] = uv_rect[:, 0] | (uv_rect[:, 1] << 16)
+    uv_words[:count, 1] = uv_rect[:, 2] | (uv_rect[:, 3] << 16)
+    alpha[:count] = np.rint(data[:, 6] * 255.0).astype(np.uint8)
+
+    return gpu.types.GPUUniformBuf(block)
+
+def _build_instance_blocks(entries):
+    # Consecutive images sharing an atlas page are drawn by one instanced
+    # call, split only when a run outgrows the uniform buffer.
+    runs = []
+    for gpu_tex, row in entries:
+        if not runs or runs[-1][0] is not gpu_tex or len(runs[-1][1]) == _MAX_INSTANCES:
+            runs.append((gpu_tex, []))
+        runs[-1][1].append(row)
+
+    return [(gpu_tex, _build_instances(rows), len(rows)) for gpu_tex, rows in runs]
+
+def _is_overlay_animated(scene):
+    anim = scene.animation_data
+    if anim is None:
+        return False
+    actions = [anim.action]
+    actions.extend(strip.action for track in anim.nla_tracks for strip in track.strips)
+    fcurves = list(anim.drivers)
+    for action in actions:
+        if action is not None:
+            fcurves.extend(action.fcurves)
+    return any(fcurve.data_path.startswith("ryref_images") for fcurve in fcurves)
+
 def draw_overlay():
+    global _instance_cache, _instance_cache_key
+    global _dirty, _overlay_animated, _overlay_scene
+
+    # Offscreen and preview redraws have no overlay settings to respect, and
+    # a viewport with overlays switched off shouldn't show references either.
+    space = bpy.context.space_data
+    if space is None or space.type != 'VIEW_3D' or not space.overlay.show_overlays:
+        return
+
     scene = bpy.context.scene
     if not scene.ryref_references_on:
         return
+    playing = bpy.context.screen.is_animation_playing
+    if scene.ryref_hide_during_playback and playing:
+        return
+
+    images = scene.ryref_images
+    if len(images) == 0 or not _has_visible_images(scene, images):
+        return
+
+    # Blender clears the viewport every frame so the overlay must still be
+    # drawn, but during playback nothing about it changes unless a property
+    # was edited or keyframed, and the cached instances can be drawn as-is.
+    if playing and not _dirty and not _overlay_animated and scene == _overlay_scene:
+        _draw_instances()
+        return
 
-    for img_data in scene.ryref_images:
+    entries = []
+    for img_data in images:
         if not img_data.visible:
             continue
 
-        filepath = img_data.filepath
+        # Images are never loaded on the draw path; a miss is queued for the
+        # load timer and the image simply appears on a later redraw.
+        filepath = _cache_key(img_data.filepath)
         if filepath not in _image_cache:
-            try:
-                image = bpy.data.images.load(filepath, check_existing=True)
-                image.gl_load()
-                gpu_tex = gpu.texture.from_image(image)
-                _image_cache[filepath] = (image, gpu_tex)
-            except Exception:
-                continue
-        else:
-            image, gpu_tex = _image_cache[filepath]
-
-        if not image.has_data or image.size[0] == 0 or image.size[1] == 0:
+            _request_image_load(filepath)
             continue
 
-        x, y = img_data.position
-        sx, sy = img_data.scale
-
-        width = image.size[0] * sx
-        height = image.size[1] * sy
-
-        coords = [
-            (x, y),
-            (x + width, y),
-            (x + width, y + height),
-            (x, y + height),
-        ]
-
-        uvs = [(0, 0), (1, 0), (1, 1), (0, 1)]
-        if img_data.flip_x:
-            uvs = [(1 - u, v) for u, v in uvs]
-        if img_data.flip_y:
-            uvs = [(u, 1 - v) for u, v in uvs]
-
-        indices = [(0, 1, 2), (2, 3, 0)]
+        cached = _image_cache[filepath]
+        if cached is None or not cached.ready:
+            continue
+        uv_rect = cached.uv_variants[(img_data.flip_x << 1) | img_data.flip_y]
+
+        entries.append((cached.texture(), (
+            *img_data.position, *img_data.scale, *cached.size, img_data.opacity, *uv_rect
+        )))
+
+    # Grouping images by texture merges them into fewer instanced draws at
+    # the cost of list order no longer deciding which image is drawn on top.
+    if not scene.ryref_preserve_order:
+        entries.sort(key=lambda entry: id(entry[0]))
+
+    # The instance data only changes when an image is moved, scaled, flipped,
+    # faded or swapped, so steady-state redraws reuse the previous buffers.
+    key = tuple((id(gpu_tex), row) for gpu_tex, row in entries)
+    if key != _instance_cache_key:
+        _instance_cache = _build_instance_blocks(entries)
+        _instance_cache_key = key
+    _overlay_animated = _is_overlay_animated(scene)
+    _overlay_scene = scene
+    _dirty = False
+
+    _draw_instances()
+
+def _draw_instances():
+    if not _instance_cache:
+        return
 
-        batch = batch_for_shader(
-            _shader, 'TRIS',
-            {"pos": coords, "texCoord": uvs},
-            indices=indices
-        )
+    shader = _get_shader()
+    quad_batch = _get_quad_batch()
 
-        gpu.state.blend_set('ALPHA')
-        _shader.bind()
-        _shader.uniform_sampler("image", gpu_tex)
-        _shader.uniform_float("color", (1.0, 1.0, 1.0, img_data.opacity))
-        batch.draw(_shader)
-        gpu.state.blend_set('NONE')
+    # Blend state is switched once for the whole overlay and handed back the
+    # way it was found, rather than forced to NONE for later draw callbacks.
+    previous_blend = gpu.state.blend_get()
+    gpu.state.blend_set('ALPHA')
+    shader.bind()
+    for gpu_tex, instances, count in _instance_cache:
+        shader.uniform_sampler("image", gpu_tex)
+        shader.uniform_block("instances", instances)
+        quad_batch.draw_instanced(shader, instance_count=count)
+    gpu.state.blend_set(previous_blend)
 
 class RYREF_OT_add_image(bpy.types.Operator):
     """Add a reference image to the overlay system"""
@@ -160,15 +655,19 @@ class RYREF_OT_add_image(bpy.types.Operator):
     def execute(self, context):
         img = context.scene.ryref_images.add()
         img.filepath = self.filepath
+        # A cached None is a previous failed load; the file may exist now.
+        filepath = _cache_key(self.filepath)
+        if _image_cache.get(filepath) is None:
+            _load_image(filepath)
+            _upload_atlas_pages()
 
-        filename = os.path.basename(self.filepath)
-        name = os.path.splitext(filename)[0]
-        img.name = name
+        img.name = PurePath(self.filepath).stem
         img.position = (100.0, 100.0)
         img.scale = (0.2, 0.2)
         img.opacity = 1.0
 
         context.scene.ryref_index = len(context.scene.ryref_images) - 1
+        _invalidate_visibility()
         tag_redraw()
         return {'FINISHED'}
 
@@ -184,10 +683,11 @@ class RYREF_OT_remove_image(bpy.types.Operator):
     def execute(self, context):
         idx = context.scene.ryref_index
         if 0 <= idx < len(context.scene.ryref_images):
-            img = context.scene.ryref_images[idx]
-            _image_cache.pop(img.filepath, None)
+            filepath = _cache_key(context.scene.ryref_images[idx].filepath)
             context.scene.ryref_images.remove(idx)
+            _release_unused_image(filepath)
             context.scene.ryref_index = max(0, idx - 1)
+        _invalidate_visibility()
         tag_redraw()
         return {'FINISHED'}
 
@@ -215,10 +715,12 @@ class RYREF_OT_move_image(bpy.types.Operator):
         tag_redraw()
         return {'FINISHED'}
 
+_VISIBLE_ICONS = ('HIDE_ON', 'HIDE_OFF')
+
 class RYREF_UL_ImageList(bpy.types.UIList):
     def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
         row = layout.row(align=True)
-        row.prop(item, "visible", text="", icon='HIDE_OFF' if item.visible else 'HIDE_ON', emboss=False)
+        row.prop(item, "visible", text="", icon=_VISIBLE_ICONS[item.visible], emboss=False)
         row.prop(item, "name", text="", emboss=False)
 
 class RYREF_PT_panel(bpy.types.Panel):
@@ -235,6 +737,8 @@ class RYREF_PT_panel(bpy.types.Panel):
 
         label = "References On" if scene.ryref_references_on else "References Off"
         layout.prop(scene, "ryref_references_on", toggle=True, text=label)
+        layout.prop(scene, "ryref_hide_during_playback")
+        layout.prop(scene, "ryref_preserve_order")
 
         row = layout.row(align=True)
         row.operator("ryref.add_image", icon="ADD", text="")
@@ -271,6 +775,13 @@ classes = (
     RYREF_PT_panel,
 )
 
+def _visibility_handlers():
+    return (
+        bpy.app.handlers.load_post,
+        bpy.app.handlers.undo_post,
+        bpy.app.handlers.redo_post,
+    )
+
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
@@ -282,12 +793,47 @@ def register():
         description="Toggle visibility of all reference overlays",
         default=True
     )
+    bpy.types.Scene.ryref_hide_during_playback = BoolProperty(
+        name="Hide During Playback",
+        description="Hide all reference overlays while an animation is playing",
+        default=False,
+        update=_on_prop_update
+    )
+    bpy.types.Scene.ryref_preserve_order = BoolProperty(
+        name="Preserve Order",
+        description="Draw references in list order. Disable to group them by texture into fewer draw calls when overlap order doesn't matter",
+        default=True,
+        update=_on_prop_update
+    )
 
     global _draw_handle
     _draw_handle = bpy.types.SpaceView3D.draw_handler_add(draw_overlay, (), 'WINDOW', 'POST_PIXEL')
 
+    bpy.app.handlers.load_pre.append(_clear_image_cache)
+    bpy.app.handlers.save_post.append(_clear_cache_keys)
+    for handlers in _visibility_handlers():
+        handlers.append(_invalidate_visibility)
+
 def unregister():
-    global _draw_handle
+    global _draw_handle, _instance_cache_key, _pending_tag, _overlay_scene
+    if bpy.app.timers.is_registered(_flush_tag):
+        bpy.app.timers.unregister(_flush_tag)
+    _pending_tag = False
+
+    if bpy.app.timers.is_registered(_load_pending_images):
+        bpy.app.timers.unregister(_load_pending_images)
+    _pending_loads.clear()
+
+    if _clear_image_cache in bpy.app.handlers.load_pre:
+        bpy.app.handlers.load_pre.remove(_clear_image_cache)
+    if _clear_cache_keys in bpy.app.handlers.save_post:
+        bpy.app.handlers.save_post.remove(_clear_cache_keys)
+
+    for handlers in _visibility_handlers():
+        if _invalidate_visibility in handlers:
+            handlers.remove(_invalidate_visibility)
+    _invalidate_visibility()
+
     if _draw_handle:
         bpy.types.SpaceView3D.draw_handler_remove(_draw_handle, 'WINDOW')
         _draw_handle = None
@@ -295,8 +841,17 @@ def unregister():
     del bpy.types.Scene.ryref_images
     del bpy.types.Scene.ryref_index
     del bpy.types.Scene.ryref_references_on
+    del bpy.types.Scene.ryref_hide_during_playback
+    del bpy.types.Scene.ryref_preserve_order
 
+    for page in _atlas_pages:
+        page.free()
+    _atlas_pages.clear()
     _image_cache.clear()
+    _cache_keys.clear()
+    _instance_cache.clear()
+    _instance_cache_key = None
+    _overlay_scene = None
 
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)